@@ -0,0 +1,112 @@
+"""Persistent cache of lint results."""
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+class ResultCache:
+    """
+    Cache the formatted errors of a file on disk.
+
+    Entries are keyed on the file name, the source code and the settings
+    that affect the result, so a file is linted again as soon as either
+    changes.
+
+    Parameters
+    ----------
+    directory : Path
+        The cache directory.
+    settings : str
+        A description of the settings that affect the lint result.
+    """
+
+    def __init__(self, directory: Path, settings: str) -> None:
+        self.directory = directory
+        self.settings = settings
+
+    def _entry(self, code: str, filename: str) -> Path:
+        key = hashlib.blake2b(digest_size=16)
+        key.update(self.settings.encode("utf-8"))
+        key.update(b"\0")
+        key.update(filename.encode("utf-8"))
+        key.update(b"\0")
+        key.update(code.encode("utf-8", errors="surrogatepass"))
+        return self.directory / f"{key.hexdigest()}.json"
+
+    def get(self, code: str, filename: str) -> Optional[Tuple[str, int]]:
+        """
+        Get the cached result.
+
+        Parameters
+        ----------
+        code : str
+            The source code.
+        filename : str
+            The file name.
+
+        Returns
+        -------
+        Optional[Tuple[str, int]]
+            The formatted errors and the number of errors or None if the
+            result is not cached.
+        """
+        try:
+            with self._entry(code, filename).open("r", encoding="utf-8") as file:
+                output, errors = json.load(file)
+            return output, errors
+        except (OSError, ValueError):
+            return None
+
+    def set(self, code: str, filename: str, result: Tuple[str, int]) -> None:
+        """
+        Cache a result.
+
+        Parameters
+        ----------
+        code : str
+            The source code.
+        filename : str
+            The file name.
+        result : Tuple[str, int]
+            The formatted errors and the number of errors.
+        """
+        entry = self._entry(code, filename)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Workers must never read a partially written entry.
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(list(result), file)
+            os.replace(tmp, entry)
+        except BaseException as error:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            if not isinstance(error, OSError):
+                raise
+
+
+def package_fingerprint() -> str:
+    """
+    Fingerprint the installed sources of numpydoc-lint.
+
+    Returns
+    -------
+    str
+        A digest of the source files of the package.
+    """
+    key = hashlib.blake2b(digest_size=16)
+    root = Path(__file__).parent
+    for path in sorted(root.rglob("*.py")):
+        key.update(path.relative_to(root).as_posix().encode("utf-8"))
+        key.update(b"\0")
+        key.update(path.read_bytes())
+        key.update(b"\0")
+    return key.hexdigest()
@@ -1,11 +1,54 @@
 """Command line interface for numpydoc-lint."""
-import tomli
+import functools
+import sys
 from pathlib import Path
-from typing import Optional, List, Mapping
+from typing import Iterable, Optional, List
 from .check._base import Check
 from .check import __dict__ as CHECKS, __all__ as ALL_CHECKS
 
 
+class _PrefixTrie:
+    """
+    Match strings against a set of prefixes.
+
+    Parameters
+    ----------
+    prefixes : Iterable[str]
+        The prefixes.
+    """
+
+    def __init__(self, prefixes: Iterable[str]) -> None:
+        self._root = {}
+        for prefix in prefixes:
+            node = self._root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[None] = True
+
+    def match(self, string: str) -> bool:
+        """
+        Determine if a string starts with any of the prefixes.
+
+        Parameters
+        ----------
+        string : str
+            The string.
+
+        Returns
+        -------
+        bool
+            True if the string starts with a prefix.
+        """
+        node = self._root
+        for char in string:
+            if None in node:
+                return True
+            node = node.get(char)
+            if node is None:
+                return False
+        return None in node
+
+
 class Config:
     def __init__(
         self,
@@ -20,22 +63,25 @@ class Config:
         self.exclude = exclude
         self.include_private = include_private
         self.exclude_magic = exclude_magic
+        self._ignore_codes = frozenset(sys.intern(code) for code in ignore or ())
+        self._select = _PrefixTrie(select) if select is not None else None
+        self._exclude_patterns = tuple(dict.fromkeys(exclude or ()))
+        self._ignored_codes = {}
         self._checks = None
 
-    def get_checks(self) -> Mapping[str, Check]:
-        if self.select is None:
-            return [CHECKS[s]() for s in ALL_CHECKS]
-        else:
-            return [
-                CHECKS[name]()
-                for name in ALL_CHECKS
-                if not self.is_error_ignored(name) and self.is_selected(name)
+    def get_checks(self) -> List[Check]:
+        if self._checks is None:
+            self._checks = [
+                CHECKS[name]() for name in ALL_CHECKS if not self.is_error_ignored(name)
             ]
+        return self._checks
 
     def is_error_ignored(self, code):
-        return (
-            self.ignore is not None and code in self.ignore
-        ) or not self.is_selected(code)
+        ignored = self._ignored_codes.get(code)
+        if ignored is None:
+            ignored = code in self._ignore_codes or not self.is_selected(code)
+            self._ignored_codes[code] = ignored
+        return ignored
 
     def is_path_excluded(self, path: Path):
         """
@@ -47,9 +93,7 @@ class Config:
             The path.
 
         """
-        return self.exclude is not None and any(
-            path.match(exclude) for exclude in self.exclude
-        )
+        return any(path.match(exclude) for exclude in self._exclude_patterns)
 
     def is_node_excluded(self, node):
         if not self.include_private and node.is_private:
@@ -61,9 +105,7 @@ class Config:
         return False
 
     def is_selected(self, code):
-        return self.select is None or any(
-            code.startswith(selected) for selected in self.select
-        )
+        return self._select is None or self._select.match(code)
 
     @property
     def is_defined(self):
@@ -79,36 +121,77 @@ class Config:
         return str(self.__dict__)
 
 
-def load_config_from_pyproject(file: Path):
-    def _find_pyproject(path):
-        if path.is_file():
-            path = path.parent
+@functools.lru_cache(maxsize=None)
+def _find_pyproject(path: Path) -> Optional[Path]:
+    """
+    Find the closest `pyproject.toml` in `path` or any of its parents.
+
+    Parameters
+    ----------
+    path : Path
+        The directory to start the search from.
+
+    Returns
+    -------
+    Optional[Path]
+        The path to `pyproject.toml` or None if no file is found.
+    """
+    for directory in (path, *path.parents):
+        pyproject = directory / "pyproject.toml"
+        if pyproject.is_file():
+            return pyproject
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pyproject(pyproject: Path) -> Optional[Config]:
+    """
+    Load the numpydoc-lint configuration from a `pyproject.toml`.
+
+    Parameters
+    ----------
+    pyproject : Path
+        The path to `pyproject.toml`.
+
+    Returns
+    -------
+    Optional[Config]
+        The configuration or None if the file has no `tool.numpydoc-lint` table.
+    """
+    try:
+        import tomllib
+    except ImportError:  # pragma: no cover
+        import tomli as tomllib
+
+    with pyproject.open(mode="rb") as file:
+        cfg = tomllib.load(file)
+
+    if "tool" in cfg and "numpydoc-lint" in cfg["tool"]:
+        cfg = cfg["tool"]["numpydoc-lint"]
+        return Config(
+            ignore=cfg.get("ignore", None),
+            select=cfg.get("select", None),
+            exclude=cfg.get("exclude", None),
+            include_private=cfg.get("include-private", None),
+            exclude_magic=cfg.get("exclude-magic", None),
+        )
+    return None
 
-        for file in path.iterdir():
-            if file.is_file() and file.name == "pyproject.toml":
-                return file
-        if path == path.parent:
-            return None
-        else:
-            return _find_pyproject(path.parent)
 
-    pyproject = _find_pyproject(file)
+class _DefaultConfig(Config):
+    @property
+    def is_defined(self):
+        return True
+
+
+def load_config_from_pyproject(file: Path):
+    # Resolved, so that relative paths (e.g., `.`) are searched up to the root.
+    path = file.resolve()
+    pyproject = _find_pyproject(path.parent if path.is_file() else path)
 
     if pyproject:
-        cfg = tomli.load(pyproject.open(mode="rb"))
-        if "tool" in cfg and "numpydoc-lint" in cfg["tool"]:
-            cfg = cfg["tool"]["numpydoc-lint"]
-            return Config(
-                ignore=cfg.get("ignore", None),
-                select=cfg.get("select", None),
-                exclude=cfg.get("exclude", None),
-                include_private=cfg.get("include-private", None),
-                exclude_magic=cfg.get("exclude-magic", None),
-            )
-
-    class C(Config):
-        @property
-        def is_defined(self):
-            return True
+        config = _load_pyproject(pyproject)
+        if config is not None:
+            return config
 
-    return C()
+    return _DefaultConfig()
@@ -56,7 +56,6 @@ _ERRORS = {
     "E0002": "Section underline is too short or too long.",
     "E0003": "Unexpected section `{section}`.",
     # See Also
-    "E1001": "Malformed item in `See Also`.",
     "E1002": "Unexpected comma or period after function list in `See Also`.",
     "E1003": "Malformed `See Also` entry.",
     # Parameter
@@ -78,7 +77,8 @@ def make_error(
 
     return Error(
         code=code,
-        message=message if message_args is None else message.format(**message_args),
+        message=message,
+        message_args=message_args,
         suggestion=suggestion,
         start=start,
         end=end,
@@ -1,27 +1,16 @@
 from dataclasses import dataclass
+from functools import cached_property
 
 from typing import List, Mapping
 
 
-@dataclass
+@dataclass(slots=True)
 class Pos:
     """Represent a Line:Column position."""
 
     line: int
     column: int
 
-    def move_line(self, *, line=None, column=None):
-        return Pos(
-            self.line + line if line is not None else self.line,
-            column if column is not None else self.column,
-        )
-
-    def move_column(self, *, line=None, column=None):
-        return Pos(
-            line if line is not None else self.line,
-            self.column + column if column is not None else self.column,
-        )
-
     def move(self, *, line=None, column=None, absolute_line=None, absolute_column=None):
         if line is not None:
             line = self.line + line
@@ -144,6 +133,7 @@ class Error:
         end: Pos = None,
         code: str = None,
         message: str = None,
+        message_args: dict = None,
         suggestion: str = None,
     ) -> None:
         if start is None:
@@ -152,15 +142,18 @@ class Error:
         self.end = end if end is not None else start
         self._code = code
         self._message = message
+        self._message_args = message_args
         self._suggestion = suggestion
 
     @property
     def code(self):
         return self._code if self._code is not None else self.__class__.__name__.upper()
 
-    @property
+    @cached_property
     def message(self):
-        return self._message
+        if self._message is None or self._message_args is None:
+            return self._message
+        return self._message.format(**self._message_args)
 
     @property
     def suggestion(self):
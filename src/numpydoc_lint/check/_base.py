@@ -1,4 +1,5 @@
 import re
+import sys
 from abc import ABCMeta, abstractmethod
 from typing import Generator, List, Optional
 
@@ -10,11 +11,20 @@ DIRECTIVES = ["versionadded", "versionchanged", "deprecated"]
 DIRECTIVE_PATTERN = re.compile(
     r"^\s*\.\. ({})(?!::)".format("|".join(DIRECTIVES)), re.I
 )
+_LEADING_SPACE_PATTERN = re.compile(r"^(\s*)")
 
 
 class Check(metaclass=ABCMeta):
     """Abstract docstring check."""
 
+    requires_summary = False
+
+    name = "Check"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.name = sys.intern(cls.__name__)
+
     @abstractmethod
     def _validate(
         self, doc: Node, docstring: DocString
@@ -55,10 +65,6 @@ class Check(metaclass=ABCMeta):
             suggestion=suggestion,
         )
 
-    @property
-    def name(self):
-        return self.__class__.__name__
-
 
 def _before_directive(lines: List[Line]) -> List[Line]:
     new_lines = []
@@ -66,12 +72,24 @@ def _before_directive(lines: List[Line]) -> List[Line]:
         if any(f".. {directive}" in line.value for directive in DIRECTIVES):
             return new_lines
 
-        if line.value.strip():
+        if line.value and not line.value.isspace():
             new_lines.append(line)
 
     return new_lines
 
 
+def _is_empty_before_directive(lines: List[Line]) -> bool:
+    # Same as `not _before_directive(lines)`.
+    for line in lines:
+        if any(f".. {directive}" in line.value for directive in DIRECTIVES):
+            return True
+
+        if line.value and not line.value.isspace():
+            return False
+
+    return True
+
+
 # TODO: Improve placement of error message
 def _validate_parameter_has_description(
     *,
@@ -81,10 +99,7 @@ def _validate_parameter_has_description(
     message_args: dict,
     suggestion: str,
 ) -> Generator[Error, None, None]:
-    if not parameter.description.data or all(
-        line.value.strip() == ""
-        for line in _before_directive(parameter.description.data)
-    ):
+    if _is_empty_before_directive(parameter.description.data):
         name = parameter.name if parameter.name is not None else parameter.types[0]
         yield make_error(
             start=name.start,
@@ -107,7 +122,7 @@ def _validate_parameter_description_start_uppercase(
     data = _before_directive(parameter.description.data)
     if data:
         first = data[0].value.lstrip()
-        if first and first[0].isalpha() and not first[0].isupper():
+        if first and is_lowercase_letter(first[0]):
             name = parameter.name if parameter.name is not None else parameter.types[0]
             yield make_error(
                 start=name.start,
@@ -131,7 +146,7 @@ def _validate_parameter_description_ends_period(
     if data:
         last = data[-1].value
         if last:
-            match = re.match("^(\s*)", last)
+            match = _LEADING_SPACE_PATTERN.match(last)
             indent = 0
             if match:
                 start, end = match.span(1)
@@ -157,7 +172,7 @@ def _validate_parameter_description_ends_period(
 def empty_prefix_lines(lines: List[Line]):
     i = 0
     for line in lines:
-        if line.value.strip():
+        if line.value and not line.value.isspace():
             break
         i += 1
     return i
@@ -166,7 +181,7 @@ def empty_prefix_lines(lines: List[Line]):
 def empty_suffix_lines(lines: List[Line]):
     i = 0
     for line in reversed(lines):
-        if line.value.strip():
+        if line.value and not line.value.isspace():
             break
         i += 1
     return i
@@ -174,6 +189,25 @@ def empty_suffix_lines(lines: List[Line]):
 
 def first_non_blank(lines: List[Line]) -> Optional[Line]:
     for line in lines:
-        if line.value.strip():
+        if line.value and not line.value.isspace():
             return line
     return None
+
+
+def is_lowercase_letter(letter: str) -> bool:
+    """
+    Determine if a character is a letter that is not uppercase.
+
+    Parameters
+    ----------
+    letter : str
+        A single character.
+
+    Returns
+    -------
+    bool
+        True if the letter is not uppercase.
+    """
+    if letter <= "\x7f":
+        return "a" <= letter <= "z"
+    return letter.isalpha() and not letter.isupper()
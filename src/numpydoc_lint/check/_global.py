@@ -8,14 +8,25 @@ from ..numpydoc import (
     ALLOWED_SECTIONS,
     DIRECTIVE_PATTERN,
     DEPRECATED_START_PATTERN,
+    EXAMPLES_SECTION,
+    SECTION_KEYS,
+    YIELDS_SECTION,
 )
-from ._base import Check, Error, empty_suffix_lines, first_non_blank
+from ._base import (
+    Check,
+    Error,
+    empty_suffix_lines,
+    first_non_blank,
+    is_lowercase_letter,
+)
+
+_LEADING_TABS_PATTERN = re.compile(r"^(\t+)")
 
 
 def _find_deprectated(paragraph: DocStringParagraph):
     if paragraph:
         for line in paragraph.data:
-            match = re.search(DEPRECATED_START_PATTERN, line.value)
+            match = DEPRECATED_START_PATTERN.search(line.value)
             if match:
                 yield (
                     line.pos.move(absolute_column=match.start(1) + 1),
@@ -28,7 +39,7 @@ class H0004(Check):
         self, node: Node, docstring: DocString
     ) -> Generator[Error, None, None]:
         if node.type in ("function", "method"):
-            if not docstring.sections.get("yields") and node.yields > 0:
+            if not docstring.sections.get(YIELDS_SECTION) and node.yields > 0:
                 yield self.new_error(
                     start=node.name.start,
                     end=node.name.end,
@@ -42,7 +53,7 @@ class H0002(Check):
         node: Node,
         docstring: DocString,
     ) -> Generator[Error, None, None]:
-        if not docstring.sections.get("examples"):
+        if not docstring.sections.get(EXAMPLES_SECTION):
             yield self.new_error(
                 start=node.name.start,
                 end=node.name.end,
@@ -51,6 +62,8 @@ class H0002(Check):
 
 
 class H0001(Check):
+    requires_summary = True
+
     def _validate(
         self, node: Node, docstring: DocString
     ) -> Generator[Error, None, None]:
@@ -75,89 +88,88 @@ class H0003(Check):
 
 
 class I0009(Check):
+    requires_summary = True
+
     def _validate(
         self, node: Node, docstring: DocString
     ) -> Generator[Error, None, None]:
-        if docstring.summary:
-            data = docstring.summary.content.data
-            first_line = first_non_blank(data)
-            if not first_line:
-                return
-
-            first_letter = first_line.value.strip()[0]
-            if first_letter.isalpha() and not first_letter.isupper():
-                column = len(first_line.value) - len(first_line.value.lstrip())
-                yield self.new_error(
-                    start=first_line.pos,
-                    code="I0009",
-                    suggestion=(
-                        f"Replace `{first_letter}` with `{first_letter.upper()}`"
-                    ),
-                )
+        data = docstring.summary.content.data
+        first_line = first_non_blank(data)
+        if not first_line:
+            return
+
+        first_letter = first_line.value.strip()[0]
+        if is_lowercase_letter(first_letter):
+            yield self.new_error(
+                start=first_line.pos,
+                code="I0009",
+                suggestion=f"Replace `{first_letter}` with `{first_letter.upper()}`",
+            )
 
 
 class I0010(Check):
     """Validate that the summary ends with a period."""
 
+    requires_summary = True
+
     def _validate(
         self, node: Node, docstring: DocString
     ) -> Generator[Error, None, None]:
-        if docstring.summary:
-            data = docstring.summary.content.data
-            if data and data[0].value[-1] != ".":
-                yield self.new_error(
-                    start=data[0].pos,
-                    end=data[0].pos.move(absolute_column=len(data[0].value) + 1),
-                    suggestion="Insert a period.",
-                )
+        data = docstring.summary.content.data
+        if data and data[0].value[-1] != ".":
+            yield self.new_error(
+                start=data[0].pos,
+                end=data[0].pos.move(absolute_column=len(data[0].value) + 1),
+                suggestion="Insert a period.",
+            )
 
 
 class I0011(Check):
+    requires_summary = True
+
     def _validate(
         self, node: Node, docstring: DocString
     ) -> Generator[Error, None, None]:
-        if docstring.summary:
-            data = docstring.summary.content.data
-            indent = docstring.indent
-            first_line_indent = len(data[0].value) - len(data[0].value.lstrip())
-            if first_line_indent != indent:
-                yield self.new_error(
-                    start=data[0].pos.move(
-                        absolute_column=indent,
-                    ),
-                    end=data[0].pos.move(absolute_column=first_line_indent),
-                    code="I0011",
-                    suggestion="Remove leading whitespace.",
-                )
+        data = docstring.summary.content.data
+        indent = docstring.indent
+        first_line_indent = len(data[0].value) - len(data[0].value.lstrip())
+        if first_line_indent != indent:
+            yield self.new_error(
+                start=data[0].pos.move(
+                    absolute_column=indent,
+                ),
+                end=data[0].pos.move(absolute_column=first_line_indent),
+                code="I0011",
+                suggestion="Remove leading whitespace.",
+            )
 
 
 class I0012(Check):
+    requires_summary = True
+
     def _validate(
         self, node: Node, docstring: DocString
     ) -> Generator[Error, None, None]:
-        if docstring.summary is None:
-            return
-
         data = docstring.summary.content.data
         if node.type in ["function", "method"] and data:
-            match = re.match(r"^\s*(.*?)\s+", data[0].value)
-            if match:
-                word = match.group(1).strip()
-                if word != "" and word[-1] == "s":
-                    yield self.new_error(
-                        start=data[0].pos.move(absolute_column=match.start(1)),
-                        end=data[0].pos.move(absolute_column=match.end(1)),
-                        suggestion="Remove third person `s`",
-                    )
+            line = data[0].value
+            stripped = line.lstrip()
+            words = stripped.split(None, 1)
+            if words and len(words[0]) < len(stripped) and words[0][-1] == "s":
+                start = len(line) - len(stripped)
+                yield self.new_error(
+                    start=data[0].pos.move(absolute_column=start),
+                    end=data[0].pos.move(absolute_column=start + len(words[0])),
+                    suggestion="Remove third person `s`",
+                )
 
 
 class I0013(Check):
+    requires_summary = True
+
     def _validate(
         self, node: Node, docstring: DocString
     ) -> Generator[Error, None, None]:
-        if docstring.summary is None:
-            return
-
         data = docstring.summary.content.data
         if len(data) > 1:
             yield self.new_error(
@@ -169,12 +181,13 @@ class I0013(Check):
 class I0001(Check):
     """Check that multiline docstrings has 1 blank line before summary."""
 
+    requires_summary = True
+
     def _validate(
         self, node: Node, docstring: DocString
     ) -> Generator[Error, None, None]:
         if (
             node.has_docstring
-            and docstring.summary is not None
             and docstring.summary.content.data
             and docstring.summary.content.start.line != docstring.start.line + 1
             and docstring.start.line < docstring.end.line
@@ -226,7 +239,7 @@ class I0004(Check):
 
     def _validate(self, node: Node, docstring: DocString) -> Optional[Error]:
         for line in docstring.lines:
-            for match in re.finditer("^(\t+)", line.value):
+            for match in _LEADING_TABS_PATTERN.finditer(line.value):
                 yield Error(
                     start=line.pos.move(absolute_column=match.start(1) + 1),
                     end=line.pos.move(absolute_column=match.end(1) + 1),
@@ -255,7 +268,7 @@ class I0005(Check):
         expected_sections = [
             section
             for section in ALLOWED_SECTIONS
-            if section.lower() in docstring.sections.keys()
+            if SECTION_KEYS[section] in docstring.sections
         ]
         actual_sections = [
             section
@@ -276,10 +289,12 @@ class I0005(Check):
 
 
 class I0006(Check):
+    requires_summary = True
+
     def _validate(
         self, node: Node, docstring: DocString
     ) -> Generator[Error, None, None]:
-        if docstring.summary and docstring.summary.extended_content:
+        if docstring.summary.extended_content:
             deprecated_markers = list(
                 _find_deprectated(docstring.summary.extended_content),
             )
@@ -298,10 +313,12 @@ class I0006(Check):
 
 
 class I0007(Check):
+    requires_summary = True
+
     def _validate(
         self, node: Node, docstring: DocString
     ) -> Generator[Error, None, None]:
-        if docstring.summary and docstring.summary.extended_content:
+        if docstring.summary.extended_content:
             marks = list(
                 _find_deprectated(docstring.summary.extended_content),
             )
@@ -336,7 +353,7 @@ class I0008(Check):
         self, node: Node, docstring: DocString
     ) -> Generator[Error, None, None]:
         for line in docstring.lines:
-            match = re.match(DIRECTIVE_PATTERN, line.value)
+            match = DIRECTIVE_PATTERN.match(line.value)
             if match:
                 yield self.new_error(
                     start=line.pos.move(absolute_column=match.start(1) + 1),
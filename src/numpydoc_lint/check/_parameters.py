@@ -3,7 +3,14 @@ from abc import ABCMeta, abstractmethod
 from typing import Generator, List, Tuple
 import itertools
 
-from ..numpydoc import DocString, DocStringParameter, Node, Parameter
+from ..numpydoc import (
+    DocString,
+    DocStringParameter,
+    Node,
+    Parameter,
+    OTHER_PARAMETERS_SECTION,
+    PARAMETERS_SECTION,
+)
 from ._base import (
     Check,
     Error,
@@ -14,6 +21,9 @@ from ._base import (
     empty_suffix_lines,
 )
 
+_EMPTY_SET_PATTERN = re.compile(r"{\s*}")
+_COLON_SPACING_PATTERN = re.compile(r"(\S:|:\S|:\s*$|^\s*:)")
+
 
 class ParameterCheck(Check, metaclass=ABCMeta):
     def _validate(
@@ -55,8 +65,8 @@ def _get_all_parameters(
     List[Parameter]
         All parameters defined in `parameters` and `other parameters`.
     """
-    parameters = docstring.sections.get("parameters")
-    other_parameters = docstring.sections.get("other parameters")
+    parameters = docstring.sections.get(PARAMETERS_SECTION)
+    other_parameters = docstring.sections.get(OTHER_PARAMETERS_SECTION)
 
     parameters = parameters.contents if parameters else []
     other_parameters = other_parameters.contents if other_parameters else []
@@ -106,16 +116,12 @@ class W0101(ParameterCheck):
         docstring: DocString,
         expected_parameters: List[Parameter],
     ) -> Generator[Error, None, None]:
-        parameters = docstring.sections.get("parameters")
-        other_parameters = docstring.sections.get("other parameters")
+        parameters = docstring.sections.get(PARAMETERS_SECTION)
+        other_parameters = docstring.sections.get(OTHER_PARAMETERS_SECTION)
 
         if parameters:
-            start = parameters.name.start
-            end = parameters.name.end
             actual_parameters = [p.name.value for p in parameters.contents]
         else:
-            start = docstring.start  # TODO: this should be node.name.start
-            end = docstring.end
             actual_parameters = []
 
         # NOTE: parameters can also be documented under Other Parameter.
@@ -167,8 +173,8 @@ class W0103(ParameterCheck):
         docstring: DocString,
         declared_parameters: List[Parameter],
     ) -> Generator[Error, None, None]:
-        parameters = docstring.sections.get("parameters")
-        other_parameters = docstring.sections.get("other parameters")
+        parameters = docstring.sections.get(PARAMETERS_SECTION)
+        other_parameters = docstring.sections.get(OTHER_PARAMETERS_SECTION)
         if parameters and (
             not other_parameters or (other_parameters and not other_parameters.contents)
         ):
@@ -272,7 +278,7 @@ class E0102(ParameterCheck):
         docstring: DocString,
         declared_parameters: List[Parameter],
     ) -> Generator[Error, None, None]:
-        parameters = docstring.sections.get("parameters")
+        parameters = docstring.sections.get(PARAMETERS_SECTION)
         if not parameters:
             return
         for parameter in parameters.contents:
@@ -291,7 +297,7 @@ class E0102(ParameterCheck):
                                 E0102._common_type_errors[type.value], type.value
                             ),
                         )
-                    elif re.match("{\s*}", type.value):
+                    elif _EMPTY_SET_PATTERN.match(type.value):
                         yield self.new_error(
                             message_args={"parameter": parameter.name.value},
                             code="E0103",
@@ -307,7 +313,7 @@ class ParameterDescriptionCheck(ParameterCheck, metaclass=ABCMeta):
         docstring: DocString,
         declared_parameters: List[Parameter],
     ) -> Generator[Error, None, None]:
-        parameters = docstring.sections.get("parameters")
+        parameters = docstring.sections.get(PARAMETERS_SECTION)
         if parameters:
             for i, parameter in enumerate(parameters.contents):
                 yield from self._validate_parameter_description(
@@ -394,10 +400,6 @@ class I0105(ParameterDescriptionCheck):
     def _validate_parameter_description(
         self, docstring: DocString, parameter: DocStringParameter, i: int, n: int
     ) -> Generator[Error, None, None]:
-        # parameters = docstring.sections.get("parameters")
-        # if parameters and parameters.contents:
-        #     for parameter in parameters.contents:
-        #         print(parameter.optional, parameter.types)
         if parameter.optional > 1:
             yield self.new_error(
                 message_args={"parameter": parameter.name.value},
@@ -418,10 +420,10 @@ class W0106(ParameterCheck):
         docstring: DocString,
         declared_parameters: List[Parameter],
     ) -> Generator[Error, None, None]:
-        parameters = docstring.sections.get("parameters")
+        parameters = docstring.sections.get(PARAMETERS_SECTION)
         if parameters and parameters.contents:
             for parameter in parameters.contents:
-                for match in re.finditer(r"(\S:|:\S|:\s*$|^\s*:)", parameter.header):
+                for match in _COLON_SPACING_PATTERN.finditer(parameter.header):
                     yield self.new_error(
                         message_args={"parameter": parameter.name.value},
                         start=parameter.name.start.move(column=match.start(1)),
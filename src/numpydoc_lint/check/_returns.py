@@ -1,7 +1,7 @@
 from abc import ABCMeta, abstractmethod
 from typing import Generator
 
-from ..numpydoc import DocString, DocStringParameter, Node
+from ..numpydoc import DocString, DocStringParameter, Node, RETURNS_SECTION
 from ._base import (
     Check,
     Error,
@@ -34,7 +34,7 @@ class H0005(Check):
     def _validate(
         self, node: Node, docstring: DocString
     ) -> Generator[Error, None, None]:
-        returns = docstring.sections.get("returns")
+        returns = docstring.sections.get(RETURNS_SECTION)
         if node.type in ("function", "method") and node.returns > 0 and not returns:
             yield self.new_error(
                 start=node.name.end,
@@ -49,7 +49,7 @@ class W0401(ReturnCheck):
         docstring: DocString,
         n_returns: int,
     ) -> Generator[Error, None, None]:
-        returns = docstring.sections.get("returns")
+        returns = docstring.sections.get(RETURNS_SECTION)
         if (
             returns
             and len(returns.contents) == 1
@@ -69,7 +69,7 @@ class ReturnDescriptionCheck(ReturnCheck, metaclass=ABCMeta):
         docstring: DocString,
         n_returns: int,
     ) -> Generator[Error, None, None]:
-        returns = docstring.sections.get("returns")
+        returns = docstring.sections.get(RETURNS_SECTION)
         if returns:
             for ret in returns.contents:
                 yield from self._validate_parameter_description(docstring, ret)
@@ -1,9 +1,17 @@
 """Command line interface for numpydoc-lint."""
+import io
+import json
+import mmap
+import os
 import sys
+from collections import deque
 from pathlib import Path
-from argparse import ArgumentParser
-from .numpydoc import Parser
+from types import SimpleNamespace
+from typing import Generator, List, Optional, Tuple
+from . import __version__
+from .numpydoc import _PYTHON_VERSION, Parser
 from .validate import DetailedErrorFormatter, ErrorFormatter, Validator
+from ._cache import ResultCache, package_fingerprint
 from ._config import Config, load_config_from_pyproject
 
 _ERROR_FORMATTERS = {
@@ -12,17 +20,274 @@ _ERROR_FORMATTERS = {
 }
 
 
-def _validate(file, *, parser, config, error_formatter, path=None):
-    for node in parser.iter_docstring(file):
-        validator = Validator(config)
+def _validate(code, filename, *, parser, validator, error_formatter):
+    errors = []
+    validate = validator.validate
+    for node in parser.iter_code_docstring(code, filename):
+        errors.extend((node, error) for error in validate(node))
 
-        for error in validator.validate(node):
-            error_formatter.add_error(
-                path.name if path is not None else file.name, node, error
-            )
+    error_formatter.add_errors(filename, errors)
 
 
-def run() -> None:
+_MMAP_THRESHOLD = 256 * 1024
+_MAX_CHUNK_SIZE = 16
+
+
+def _read_source(path: Path) -> str:
+    """
+    Read the source code of a Python file.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the file.
+
+    Returns
+    -------
+    str
+        The source code with universal newlines.
+    """
+    with path.open("rb") as file:
+        if os.fstat(file.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                code = str(buffer, encoding="utf-8", errors="replace")
+        else:
+            code = file.read().decode("utf-8", errors="replace")
+
+    return _normalize_newlines(code)
+
+
+def _read_stdin() -> str:
+    """
+    Read the source code from standard input.
+
+    Returns
+    -------
+    str
+        The source code with universal newlines.
+    """
+    buffer = getattr(sys.stdin, "buffer", None)
+    if buffer is None:  # pragma: no cover
+        return sys.stdin.read()
+
+    code = buffer.read().decode(sys.stdin.encoding or "utf-8", errors="replace")
+    return _normalize_newlines(code)
+
+
+def _normalize_newlines(code: str) -> str:
+    if "\r" in code:
+        code = code.replace("\r\n", "\n").replace("\r", "\n")
+    return code
+
+
+class _Linter:
+    """
+    Lint files and format the errors.
+
+    The linter is picklable so that files can be linted in worker processes.
+
+    Parameters
+    ----------
+    config : Config
+        The configuration.
+    error_formatter : type
+        The error formatter class.
+    cache : ResultCache, optional
+        Cache of previous results.
+    """
+
+    def __init__(
+        self, config: Config, error_formatter: type, cache: ResultCache = None
+    ) -> None:
+        self.parser = Parser()
+        self.validator = Validator(config)
+        self.error_formatter = error_formatter
+        self.cache = cache
+
+    def lint(self, code: str, filename: str, output: io.TextIOBase) -> int:
+        """
+        Lint source code and write the errors.
+
+        Parameters
+        ----------
+        code : str
+            The source code.
+        filename : str
+            The file name used when reporting errors.
+        output : io.TextIOBase
+            The output stream.
+
+        Returns
+        -------
+        int
+            The number of errors.
+        """
+        if self.cache is not None:
+            result = self.cache.get(code, filename)
+            if result is None:
+                buffer = io.StringIO()
+                errors = self._lint(code, filename, buffer)
+                result = buffer.getvalue(), errors
+                self.cache.set(code, filename, result)
+
+            output.write(result[0])
+            return result[1]
+
+        return self._lint(code, filename, output)
+
+    def _lint(self, code: str, filename: str, output: io.TextIOBase) -> int:
+        error_formatter = self.error_formatter()
+        _validate(
+            code,
+            filename,
+            parser=self.parser,
+            validator=self.validator,
+            error_formatter=error_formatter,
+        )
+        error_formatter.write(output)
+        return error_formatter.errors
+
+    def lint_path(self, path: Path, output: io.TextIOBase) -> int:
+        return self.lint(_read_source(path), str(path), output)
+
+    def format_path(self, path: Path) -> Tuple[str, int]:
+        """
+        Lint a file and return the formatted errors.
+
+        Parameters
+        ----------
+        path : Path
+            The path to the file.
+
+        Returns
+        -------
+        str
+            The formatted errors.
+        int
+            The number of errors.
+        """
+        output = io.StringIO()
+        errors = self.lint_path(path, output)
+        return output.getvalue(), errors
+
+
+# The linter of a worker process, set once by `_init_worker`.
+_worker_linter: _Linter = None
+
+
+def _init_worker(linter: _Linter) -> None:
+    global _worker_linter
+    _worker_linter = linter
+
+
+def _format_paths_in_worker(paths: List[Path]) -> List[Tuple[str, int]]:
+    return [_worker_linter.format_path(path) for path in paths]
+
+
+def _map_in_order(executor, fn, iterable, window: int) -> Generator:
+    """
+    Map a function in an executor with a bounded number of pending tasks.
+
+    Parameters
+    ----------
+    executor : Executor
+        The executor.
+    fn : callable
+        The function.
+    iterable : Iterable
+        The arguments of each task.
+    window : int
+        The maximum number of submitted tasks whose result is not consumed.
+
+    Yields
+    ------
+    object
+        The result of each task, in the order of `iterable`.
+    """
+    pending = deque()
+    for item in iterable:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _cache_settings(config: Config, args) -> str:
+    return json.dumps(
+        [
+            __version__,
+            package_fingerprint(),
+            _PYTHON_VERSION,
+            args.format,
+            config.ignore,
+            config.select,
+            config.include_private,
+            config.exclude_magic,
+        ]
+    )
+
+
+def _open_output() -> io.TextIOBase:
+    """
+    Open a block-buffered stream to standard output.
+
+    Returns
+    -------
+    io.TextIOBase
+        The output stream.
+    """
+    try:
+        return open(
+            sys.stdout.fileno(),
+            mode="w",
+            buffering=1 << 20,
+            encoding=sys.stdout.encoding,
+            closefd=False,
+        )
+    except (AttributeError, OSError, ValueError):  # pragma: no cover
+        return sys.stdout
+
+
+def _iter_python_files(root: Path, config: Config) -> Generator[Path, None, None]:
+    """
+    Recursively find all Python files that are not excluded.
+
+    Parameters
+    ----------
+    root : Path
+        The directory to search.
+    config : Config
+        The configuration.
+
+    Yields
+    ------
+    Path
+        The path to a Python file.
+    """
+    # Like `Path.rglob`, directories that cannot be read are skipped.
+    try:
+        with os.scandir(root) as scandir_it:
+            entries = list(scandir_it)
+    except PermissionError:
+        return
+
+    directories = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            directories.append(entry.path)
+        elif entry.name.endswith(".py") and entry.is_file():
+            path = Path(entry.path)
+            if not config.is_path_excluded(path):
+                yield path
+
+    for directory in directories:
+        yield from _iter_python_files(Path(directory), config)
+
+
+def _argument_parser():
+    from argparse import ArgumentParser
+
     parser = ArgumentParser(prog="numpydoc_lint", description="Lint numpydoc comments")
     parser.add_argument("input", nargs="?", default="-")
     parser.add_argument("--format", choices=["simple", "full"], default="simple")
@@ -32,7 +297,106 @@ def run() -> None:
     parser.add_argument("--include-private", action="store_true", default=None)
     parser.add_argument("--exclude-magic", action="store_true", default=None)
     parser.add_argument("--stdin-filename")
-    args = parser.parse_args()
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of processes used to lint a directory (default: all CPUs).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory used to cache the results of unchanged files.",
+    )
+    return parser
+
+
+_LIST_OPTIONS = {"--ignore": "ignore", "--select": "select", "--exclude": "exclude"}
+_FLAG_OPTIONS = {
+    "--include-private": "include_private",
+    "--exclude-magic": "exclude_magic",
+}
+_VALUE_OPTIONS = {
+    "--format": ("format", str),
+    "--stdin-filename": ("stdin_filename", str),
+    "-j": ("jobs", int),
+    "--jobs": ("jobs", int),
+    "--cache-dir": ("cache_dir", Path),
+}
+
+
+def _is_option(arg: str) -> bool:
+    return arg.startswith("-") and arg != "-"
+
+
+def _parse_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the command line arguments without argparse.
+
+    Only exact spellings of the options are recognized. Anything else,
+    including ``--help`` and invalid arguments, is left to argparse.
+
+    Parameters
+    ----------
+    argv : List[str]
+        The command line arguments.
+
+    Returns
+    -------
+    Optional[SimpleNamespace]
+        The parsed arguments or None if argparse must parse them.
+    """
+    args = SimpleNamespace(
+        input="-",
+        format="simple",
+        ignore=None,
+        select=None,
+        exclude=None,
+        include_private=None,
+        exclude_magic=None,
+        stdin_filename=None,
+        jobs=None,
+        cache_dir=None,
+    )
+    has_input = False
+    i, n = 0, len(argv)
+    while i < n:
+        arg = argv[i]
+        i += 1
+        if not _is_option(arg):
+            if has_input:
+                return None
+            args.input = arg
+            has_input = True
+        elif arg in _LIST_OPTIONS:
+            start = i
+            while i < n and not _is_option(argv[i]):
+                i += 1
+            setattr(args, _LIST_OPTIONS[arg], argv[start:i])
+        elif arg in _FLAG_OPTIONS:
+            setattr(args, _FLAG_OPTIONS[arg], True)
+        elif arg in _VALUE_OPTIONS and i < n and not _is_option(argv[i]):
+            name, convert = _VALUE_OPTIONS[arg]
+            try:
+                value = convert(argv[i])
+            except ValueError:
+                return None
+            # argparse checks the choice of every occurrence, not just the last.
+            if name == "format" and value not in _ERROR_FORMATTERS:
+                return None
+            setattr(args, name, value)
+            i += 1
+        else:
+            return None
+
+    return args
+
+
+def run() -> None:
+    args = _parse_args(sys.argv[1:])
+    if args is None:
+        args = _argument_parser().parse_args()
 
     config = Config(
         ignore=args.ignore,
@@ -41,8 +405,10 @@ def run() -> None:
         include_private=args.include_private,
         exclude_magic=args.exclude_magic,
     )
-    parser = Parser()
-    error_formatter = _ERROR_FORMATTERS[args.format]()
+    error_formatter = _ERROR_FORMATTERS[args.format]
+    cache = None
+    output = _open_output()
+    errors = 0
     if args.input == "-":
         if args.stdin_filename is not None:
             path = Path(args.stdin_filename)
@@ -53,12 +419,12 @@ def run() -> None:
             config = load_config_from_pyproject(path)
 
         if path is None or (path is not None and not config.is_path_excluded(path)):
-            _validate(
-                sys.stdin,
-                parser=parser,
-                config=config,
-                error_formatter=error_formatter,
-                path=path,
+            if args.cache_dir is not None:
+                cache = ResultCache(args.cache_dir, _cache_settings(config, args))
+            errors += _Linter(config, error_formatter, cache).lint(
+                _read_stdin(),
+                path.name if path is not None else sys.stdin.name,
+                output,
             )
     else:
         root = Path(args.input)
@@ -69,29 +435,37 @@ def run() -> None:
         if not config.is_defined:
             config = load_config_from_pyproject(root)
 
-        if root.is_file() and not config.is_path_excluded(root):
-            with root.open("r", encoding="utf-8") as file:
-                _validate(
-                    file,
-                    parser=parser,
-                    config=config,
-                    error_formatter=error_formatter,
-                )
+        if args.cache_dir is not None:
+            cache = ResultCache(args.cache_dir, _cache_settings(config, args))
+        linter = _Linter(config, error_formatter, cache)
+        if root.is_file():
+            if not config.is_path_excluded(root):
+                errors += linter.lint_path(root, output)
         else:
-            for path in root.rglob("*.py"):
-                if config.exclude and config.is_path_excluded(path):
-                    continue
-
-                with path.open("r", encoding="utf-8") as file:
-                    _validate(
-                        file,
-                        parser=parser,
-                        config=config,
-                        error_formatter=error_formatter,
+            paths = list(_iter_python_files(root, config))
+            jobs = args.jobs if args.jobs is not None else os.cpu_count() or 1
+            if jobs > 1 and len(paths) > 1:
+                from concurrent.futures import ProcessPoolExecutor
+
+                with ProcessPoolExecutor(
+                    max_workers=jobs, initializer=_init_worker, initargs=(linter,)
+                ) as executor:
+                    chunk_size = max(1, min(_MAX_CHUNK_SIZE, len(paths) // (jobs * 4)))
+                    chunks = (
+                        paths[start : start + chunk_size]
+                        for start in range(0, len(paths), chunk_size)
                     )
-    error_formatter.write(sys.stdout)
-    if error_formatter.has_errors:
-        print("Found {} errors.".format(error_formatter.errors))
-        sys.exit(1)
-    else:
-        sys.exit(0)
+                    for results in _map_in_order(
+                        executor, _format_paths_in_worker, chunks, window=jobs * 4
+                    ):
+                        for formatted_errors, file_errors in results:
+                            output.write(formatted_errors)
+                            errors += file_errors
+            else:
+                for path in paths:
+                    errors += linter.lint_path(path, output)
+
+    if errors > 0:
+        print("Found {} errors.".format(errors), file=output)
+    output.flush()
+    sys.exit(1 if errors > 0 else 0)
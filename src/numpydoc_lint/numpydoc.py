@@ -1,7 +1,10 @@
+from __future__ import annotations
+
+import bisect
 import re
 import sys
-from abc import ABCMeta, abstractproperty
-from typing import List, Optional, Tuple, Generator
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, List, Optional, Tuple, Generator
 from ._model import (
     DocString,
     DocStringName,
@@ -33,80 +36,91 @@ ALLOWED_SECTIONS = [
     "Examples",  # 13
 ]
 
+# Lowercase and interned keys of `DocString.sections`
+SECTION_KEYS = {section: sys.intern(section.lower()) for section in ALLOWED_SECTIONS}
+PARAMETERS_SECTION = SECTION_KEYS["Parameters"]
+OTHER_PARAMETERS_SECTION = SECTION_KEYS["Other Parameters"]
+RETURNS_SECTION = SECTION_KEYS["Returns"]
+YIELDS_SECTION = SECTION_KEYS["Yields"]
+EXAMPLES_SECTION = SECTION_KEYS["Examples"]
+
 DIRECTIVES = ["versionadded", "versionchanged", "deprecated"]
 DIRECTIVE_PATTERN = re.compile(
     r"^\s*(\.\. (:?{})(?!::))".format("|".join(DIRECTIVES)), re.I
 )
 
 DEPRECATED_START_PATTERN = re.compile(r"\s*(\.\. deprecated::)\s+")
-import parso
+
+if TYPE_CHECKING:
+    import parso
 
 # FIXME: These have been generated by AI. Checka and replace as needed.
-_MAGIC_METHODS = [
-    "__abs__",
-    "__add__",
-    "__and__",
-    "__bool__",
-    "__ceil__",
-    "__class__",
-    "__delattr__",
-    "__dir__",
-    "__divmod__",
-    "__doc__",
-    "__eq__",
-    "__float__",
-    "__floor__",
-    "__floordiv__",
-    "__format__",
-    "__ge__",
-    "__getattribute__",
-    "__getnewargs__",
-    "__gt__",
-    "__hash__",
-    "__index__",
-    "__init__",
-    "__init_subclass__",
-    "__int__",
-    "__invert__",
-    "__le__",
-    "__lshift__",
-    "__lt__",
-    "__mod__",
-    "__mul__",
-    "__ne__",
-    "__neg__",
-    "__new__",
-    "__or__",
-    "__pos__",
-    "__pow__",
-    "__radd__",
-    "__rand__",
-    "__rdivmod__",
-    "__reduce__",
-    "__reduce_ex__",
-    "__repr__",
-    "__rfloordiv__",
-    "__rlshift__",
-    "__rmod__",
-    "__rmul__",
-    "__ror__",
-    "__round__",
-    "__rpow__",
-    "__rrshift__",
-    "__rshift__",
-    "__rsub__",
-    "__rtruediv__",
-    "__rxor__",
-    "__setattr__",
-    "__sizeof__",
-    "__str__",
-    "__sub__",
-    "__subclasshook__",
-    "__truediv__",
-    "__trunc__",
-    "__xor__",
-    "__init_subclass__",
-]
+_MAGIC_METHODS = frozenset(
+    [
+        "__abs__",
+        "__add__",
+        "__and__",
+        "__bool__",
+        "__ceil__",
+        "__class__",
+        "__delattr__",
+        "__dir__",
+        "__divmod__",
+        "__doc__",
+        "__eq__",
+        "__float__",
+        "__floor__",
+        "__floordiv__",
+        "__format__",
+        "__ge__",
+        "__getattribute__",
+        "__getnewargs__",
+        "__gt__",
+        "__hash__",
+        "__index__",
+        "__init__",
+        "__init_subclass__",
+        "__int__",
+        "__invert__",
+        "__le__",
+        "__lshift__",
+        "__lt__",
+        "__mod__",
+        "__mul__",
+        "__ne__",
+        "__neg__",
+        "__new__",
+        "__or__",
+        "__pos__",
+        "__pow__",
+        "__radd__",
+        "__rand__",
+        "__rdivmod__",
+        "__reduce__",
+        "__reduce_ex__",
+        "__repr__",
+        "__rfloordiv__",
+        "__rlshift__",
+        "__rmod__",
+        "__rmul__",
+        "__ror__",
+        "__round__",
+        "__rpow__",
+        "__rrshift__",
+        "__rshift__",
+        "__rsub__",
+        "__rtruediv__",
+        "__rxor__",
+        "__setattr__",
+        "__sizeof__",
+        "__str__",
+        "__sub__",
+        "__subclasshook__",
+        "__truediv__",
+        "__trunc__",
+        "__xor__",
+    ]
+)
 SUMMARY_SIGNATURE_PATTERN = re.compile(r"^([\w., ]+=)?\s*[\w\.]+\(.*\)$")
 SECTION_UNDERLINE_PATTERN = re.compile(r"[-|=]{3,}")
 
@@ -114,44 +128,42 @@ SECTION_UNDERLINE_PATTERN = re.compile(r"[-|=]{3,}")
 class Reader:
     def __init__(self, data):
         self._lines = data
+        self._n = len(data)
+        self._stripped = [line.value.strip() for line in data]
+        self._section_starts_cache = None
         self._current_line = 0
 
     def __getitem__(self, n):
         return self._lines[n]
 
     def read(self):
-        if not self.eof():
-            out = self[self._current_line]
-            self._current_line += 1
-            return out
+        i = self._current_line
+        if i < self._n:
+            self._current_line = i + 1
+            return self._lines[i]
         else:
             return ""
 
     def eof(self):
-        return self._current_line >= len(self._lines)
-
-    def read_to_condition(self, condition_func):
-        start = self._current_line
-        for line in self[start:]:
-            if condition_func(line):
-                return self[start : self._current_line]
-            self._current_line += 1
-            if self.eof():
-                return self[start : self._current_line + 1]
-        return []
+        return self._current_line >= self._n
 
     def read_to_next_unindented_line(self):
-        def is_unindented(line):
-            return line.value.strip() and (len(line.value.lstrip()) == len(line.value))
-
-        return self.read_to_condition(is_unindented)
+        lines = self._lines
+        stripped = self._stripped
+        n = self._n
+        start = i = self._current_line
+        while i < n and not (stripped[i] and not lines[i].value[0].isspace()):
+            i += 1
+        self._current_line = i
+        return lines[start:i]
 
     def seek_next_non_blank(self):
-        for line in self._lines[self._current_line :]:
-            if line.value.strip():
-                return
-            else:
-                self._current_line += 1
+        stripped = self._stripped
+        n = self._n
+        i = self._current_line
+        while i < n and not stripped[i]:
+            i += 1
+        self._current_line = i
 
     @property
     def current_line(self):
@@ -159,43 +171,41 @@ class Reader:
 
     @property
     def current_pos(self):
-        return (
-            self[self._current_line].pos
-            if not self.eof()
-            else self[self._current_line - 1].pos
-        )
+        i = self._current_line
+        return self._lines[i].pos if i < self._n else self._lines[i - 1].pos
 
     def read_to_next_blank(self):
         if self.eof():
             return []
 
-        result = [self.read_next()]
-        while self.peek() and self.peek().value.strip() and not self.eof():
-            result.append(self.read_next())
-        return result
+        stripped = self._stripped
+        start = self._current_line
+        n = self._n
+        i = start + 1
+        while i < n and stripped[i]:
+            i += 1
+        self._current_line = i
+        return self._lines[start:i]
 
     def read_to_eof(self):
         data = self._lines[self._current_line :]
-        self._current_line = len(self._lines)
+        self._current_line = self._n
         return data
 
-    def is_at_section(self):
-        if self.eof():
-            return False
-
-        header = self.peek().value.strip() if self.peek() else ""
-        if not header.strip():
-            return False
-
-        if header.startswith(".. index::"):
-            return True
+    @property
+    def _section_starts(self):
+        if self._section_starts_cache is None:
+            self._section_starts_cache = _find_section_starts(self._stripped)
+        return self._section_starts_cache
 
-        underline = self.peek(1).value.strip() if self.peek(1) else ""
-        match = re.match(SECTION_UNDERLINE_PATTERN, underline)
-        if match:
-            return True
+    def _next_section(self, i):
+        starts = self._section_starts
+        k = bisect.bisect_left(starts, i)
+        return starts[k] if k < len(starts) else self._n
 
-        return False
+    def is_at_section(self):
+        i = self._current_line
+        return i < self._n and self._next_section(i) == i
 
     def read_next(self):
         line = self._lines[self._current_line]
@@ -203,30 +213,64 @@ class Reader:
         return line
 
     def read_to_next_header(self):
-        result = [self.read_next()]
-        while not self.is_at_section() and not self.eof():
-            result.append(self.read_next())
-        return result
+        start = self._current_line
+        self.read_next()
+        self._current_line = self._next_section(self._current_line)
+        return self._lines[start : self._current_line]
+
+    def peek_stripped(self, n=0):
+        if 0 <= self._current_line + n < self._n:
+            return self._stripped[self._current_line + n]
+        else:
+            return ""
+
+    def peek_indent(self):
+        i = self._current_line
+        if i >= self._n:
+            return 0
+        line = self._lines[i].value
+        stripped = self._stripped[i]
+        # The stripped line starts at the first non-whitespace character.
+        return line.find(stripped) if stripped else len(line)
 
     def peek(self, n=0):
-        if 0 <= self._current_line + n < len(self._lines):
+        if 0 <= self._current_line + n < self._n:
             return self[self._current_line + n]
         else:
             return None
 
 
+def _find_section_starts(stripped: List[str]) -> List[int]:
+    starts = []
+    for i, header in enumerate(stripped):
+        if not header:
+            continue
+
+        if header.startswith(".. index::"):
+            starts.append(i)
+        elif i + 1 < len(stripped):
+            # Equivalent to `SECTION_UNDERLINE_PATTERN.match`, without the regex.
+            underline = stripped[i + 1]
+            if (
+                len(underline) >= 3
+                and underline[0] in "-|="
+                and underline[1] in "-|="
+                and underline[2] in "-|="
+            ):
+                starts.append(i)
+    return starts
+
+
 def strip_empty_lines(contents):
     i = 0
-    j = 0
-    for i, line in enumerate(contents):
-        if line.value.strip():
-            break
+    j = len(contents)
+    while i < j and (not contents[i].value or contents[i].value.isspace()):
+        i += 1
 
-    for j, line in enumerate(contents[::-1]):
-        if line.value.strip():
-            break
+    while j > i and (not contents[j - 1].value or contents[j - 1].value.isspace()):
+        j -= 1
 
-    return contents[i : len(contents) - j]
+    return contents[i:j]
 
 
 class ParseError(Exception):
@@ -242,11 +286,25 @@ _PYTHON_VERSION = "{}.{}.{}".format(*sys.version_info)
 
 def _format_raw_doc(doc: str, start: Pos):
     doc_lines = doc.splitlines()
-    while doc_lines and re.match("^\s*#|^\s*$", doc_lines[0]):
-        doc_lines.pop(0)
 
-    first_delim = doc_lines[0].find('"')
-    last_delim = doc_lines[-1].rfind('"')
+    i = 0
+    while i < len(doc_lines):
+        stripped = doc_lines[i].lstrip()
+        if stripped and not stripped.startswith("#"):
+            break
+        i += 1
+    if i:
+        doc_lines = doc_lines[i:]
+
+    # Docstrings are delimited by either `"""` or `'''`, whichever comes first.
+    double_quote = doc_lines[0].find('"')
+    single_quote = doc_lines[0].find("'")
+    if single_quote != -1 and (double_quote == -1 or single_quote < double_quote):
+        quote, first_delim = "'", single_quote
+    else:
+        quote, first_delim = '"', double_quote
+
+    last_delim = doc_lines[-1].rfind(quote)
     first_r = doc_lines[0].find("r")
 
     first_delim_len = 3
@@ -266,16 +324,24 @@ def _format_raw_doc(doc: str, start: Pos):
 
     lines = [Line(start, first_line)]
     i = 1
+    if first_delim_len == 4 or "\\" not in doc:
+        lines.extend(
+            Line(start.move(line=i), doc_lines[i]) for i in range(1, len(doc_lines) - 1)
+        )
+        i = max(i, len(doc_lines) - 1)
+
     while i < len(doc_lines) - 1:
         line = doc_lines[i]
-        joined_line = line
         current_line = i
-        while len(line) >= 1 and line[-1] == "\\" and first_delim_len != 4:
-            i += 1
-            line = doc_lines[i]
-            joined_line = joined_line[:-1] + line.lstrip()
-
-        lines.append(Line(start.move(line=current_line), joined_line))
+        if line.endswith("\\") and first_delim_len != 4:
+            parts = [line[:-1]]
+            while line.endswith("\\"):
+                i += 1
+                line = doc_lines[i].lstrip()
+                parts.append(line[:-1] if line.endswith("\\") else line)
+            line = "".join(parts)
+
+        lines.append(Line(start.move(line=current_line), line))
         i += 1
 
     if len(doc_lines) > 1:
@@ -293,7 +359,7 @@ def _get_docstring_node(node):
     if node.type == "file_input":
         node = node.children[0]
     elif node.type in ("funcdef", "classdef"):
-        node = node.children[node.children.index(":") + 1]
+        node = node.children[-1]  # The body always follows the final `:`
         if node.type == "suite":  # Normally a suite
             node = node.children[1]  # -> NEWLINE stmt
     else:  # ExprStmt
@@ -316,17 +382,17 @@ _ROLE = r":(?P<role>(py:)?\w+):"
 _FUNC_BACK_TICK = r"`(?P<name>(?:~\w+\.)?[a-zA-Z0-9_\.-]+)`"
 _FUNC_PLAIN = r"(?P<name2>[a-zA-Z0-9_\.-]+)"
 _FUNC_NAME = r"(" + _ROLE + _FUNC_BACK_TICK + r"|" + _FUNC_PLAIN + r")"
-_FUNC_NAME_EXT = _FUNC_NAME.replace("role", "rolenext")
-_FUNC_NAME_EXT = _FUNC_NAME_EXT.replace("name", "namenext")
-_DESCRIPTION = r"(?P<description>\s*:(\s+(?P<desc>\S+.*))?)?\s*$"
-_FUNC_PATTERN = re.compile(r"^\s*" + _FUNC_NAME + r"\s*")
+_DESCRIPTION = r"(?:\s*:(?:\s+(?P<desc>\S+.*))?)?\s*$"
+_FUNC_NAME_PATTERN = re.compile(_FUNC_NAME)
+
+_ANY_FUNC_NAME = re.sub(r"\(\?P<\w+>|\((?!\?)", "(?:", _FUNC_NAME)
 _LINE_PATTERN = re.compile(
     r"^\s*"
     + r"(?P<allfuncs>"
-    + _FUNC_NAME  # group for all function names
-    + r"(?P<morefuncs>([,]\s+"
-    + _FUNC_NAME_EXT
-    + r")*)"
+    + _ANY_FUNC_NAME  # group for all function names
+    + r"(?:,\s+"
+    + _ANY_FUNC_NAME
+    + r")*"
     + r")"
     + r"(?P<trailing>[,\.])?"  # end of "allfuncs"
     + _DESCRIPTION  # Some function lists have a trailing comma (or period)  '\s*'
@@ -340,16 +406,6 @@ def _parse_see_also(
     indent: int,
     errors: List[Error],
 ) -> List[DocStringParameter]:
-    def parse_item_name(text: str, pos: Pos):
-        match = _FUNC_PATTERN.match(text)
-        if not match:
-            errors.append(make_error(start=pos, end=pos, code="E1001"))
-            return None
-
-        role = match.group("role")
-        name = match.group("name") if role else match.group("name2")
-        return name, role, match.end()
-
     items = []
     rest = []
     for row in data:
@@ -372,17 +428,13 @@ def _parse_see_also(
         if not description and line.startswith(" "):
             rest.append(line.strip())
         elif match:
+            # `allfuncs` has already been validated by `_LINE_PATTERN`.
             funcs = []
-            text = match.group("allfuncs")
-            while True:
-                if not text.strip():
-                    break
-
-                name, role, match_end = parse_item_name(text, row.pos)
-                funcs.append((name, role))
-                text = text[match_end:].strip()
-                if text and text[0] == ",":
-                    text = text[1:].strip()
+            for func in _FUNC_NAME_PATTERN.finditer(match.group("allfuncs")):
+                role = func.group("role")
+                funcs.append(
+                    (func.group("name") if role else func.group("name2"), role)
+                )
 
             if description:
                 rest = [description]
@@ -399,7 +451,7 @@ def _parse_see_also(
     return items
 
 
-_NAME_TYPE_PATTERN = re.compile("^\s*(?P<name>.*?)(?:\s*:\s*(?:(?P<type>.*?)\s*)?)?$")
+_NAME_TYPE_PATTERN = re.compile(r"^\s*(?P<name>.*?)(?:\s*:\s*(?:(?P<type>.*?)\s*)?)?$")
 
 # Split type declaration:
 # a, b or c -> a | b | c
@@ -408,6 +460,45 @@ _NAME_TYPE_PATTERN = re.compile("^\s*(?P<name>.*?)(?:\s*:\s*(?:(?P<type>.*?)\s*)
 _TYPE_PATTERN = re.compile(r"(?:\s*)(\{.*\}|.+?)(?:\s*(?:,(?![^()]*\))|or|$))")
 
 
+def _split_types(types: str) -> List[Tuple[int, int]]:
+    """Find the span of each type, exactly as `_TYPE_PATTERN` would."""
+    if "{" in types or "(" in types or ")" in types:
+        return [match.span(1) for match in _TYPE_PATTERN.finditer(types)]
+
+    # Without braces or parentheses, a type ends before the whitespace that
+    # precedes the next "," or "or", or at the end of the string.
+    spans = []
+    n = len(types)
+    i = 0
+    while i < n:
+        start = i
+        while start < n and types[start].isspace():
+            start += 1
+        if start == n:
+            # Only whitespace is left, which becomes a type of one character.
+            spans.append((n - 1, n))
+            break
+
+        comma = types.find(",", start + 1)
+        or_ = types.find("or", start + 1)
+        if comma == -1:
+            comma = n
+        if or_ == -1:
+            or_ = n
+        if comma < or_:
+            separator, i = comma, comma + 1
+        elif or_ < n:
+            separator, i = or_, or_ + 2
+        else:
+            separator, i = n, n
+
+        end = separator
+        while end > start + 1 and types[end - 1].isspace():
+            end -= 1
+        spans.append((start, end))
+    return spans
+
+
 def _parse_parameter_list(
     data: List[str],
     *,
@@ -415,18 +506,22 @@ def _parse_parameter_list(
     single_element_is_type: bool = False,
 ) -> List[DocStringParameter]:
     params = []
-    reader = Reader([Line(line.pos, line.value[indent:]) for line in data])
+    reader = Reader(
+        [Line(line.pos, line.value[indent:]) if line.value else line for line in data]
+    )
     while not reader.eof():
         parameter_start = reader.current_pos
+        is_blank = not reader.peek_stripped()
         param_header = reader.read()
-        if not param_header.value.strip():
+        if is_blank:
             continue
 
-        header = re.match(_NAME_TYPE_PATTERN, param_header.value)
+        line, column = param_header.pos.line, param_header.pos.column
+        header = _NAME_TYPE_PATTERN.match(param_header.value)
         if header.group("name"):
             name = DocStringName(
-                start=param_header.pos.move(column=header.start("name")),
-                end=param_header.pos.move(column=header.end("name")),
+                start=Pos(line, column + header.start("name")),
+                end=Pos(line, column + header.end("name")),
                 value=header.group("name"),
             )
         else:
@@ -435,15 +530,13 @@ def _parse_parameter_list(
         if header.group("type"):
             types = []
 
-            for type in re.finditer(_TYPE_PATTERN, header.group("type")):
+            type_column = column + header.start("type")
+            type_value = header.group("type")
+            for type_start, type_end in _split_types(type_value):
                 type = DocStringName(
-                    start=param_header.pos.move(
-                        column=header.start("type") + type.start(1)
-                    ),
-                    end=param_header.pos.move(
-                        column=header.start("type") + type.end(1)
-                    ),
-                    value=type.group(1),
+                    start=Pos(line, type_column + type_start),
+                    end=Pos(line, type_column + type_end),
+                    value=type_value[type_start:type_end],
                 )
 
                 if type.value == "optional":
@@ -511,6 +604,23 @@ def _parse_summary(*, reader: Reader) -> DocStringSummary:
     return summary
 
 
+_parse_type_list = partial(_parse_parameter_list, single_element_is_type=True)
+
+# The parser of each section and whether it reports errors.
+_SECTION_PARSERS = {
+    "parameters": (_parse_parameter_list, False),
+    "other parameters": (_parse_parameter_list, False),
+    "attributes": (_parse_parameter_list, False),
+    "methods": (_parse_parameter_list, False),
+    "returns": (_parse_type_list, False),
+    "yields": (_parse_type_list, False),
+    "raises": (_parse_type_list, False),
+    "warns": (_parse_type_list, False),
+    "receives": (_parse_type_list, False),
+    "see also": (_parse_see_also, True),
+}
+
+
 def _parse_sections(
     *,
     reader: Reader,
@@ -522,41 +632,28 @@ def _parse_sections(
         current_pos = reader.current_pos
 
         # TODO: make the intent more clear with peek.
-        if reader.peek(-1) and reader.peek(-1).value.strip():
+        if reader.peek_stripped(-1):
             errors.append(make_error(start=current_pos, code="E0001"))
 
+        name = reader.peek_stripped()
+        underline = reader.peek_stripped(1)
+        column = reader.peek_indent() + 1
         data = reader.read_to_next_header()
         if not data:
             sections = []
             break
 
-        column = len(data[0].value) - len(data[0].value.lstrip()) + 1
-
         if len(data) > 1:
-            name = data[0].value.strip()
-            underline = data[1].value.strip()
-            valid = re.match(SECTION_UNDERLINE_PATTERN, underline)
-
-            lower_name = name.lower()
-            if lower_name in (
-                "parameters",
-                "other parameters",
-                "attributes",
-                "methods",
-            ):
-                contents = _parse_parameter_list(data[2:], indent=indent)
-            elif lower_name in (
-                "returns",
-                "yields",
-                "raises",
-                "warns",
-                "receives",
-            ):
-                contents = _parse_parameter_list(
-                    data[2:], indent=indent, single_element_is_type=True
-                )
-            elif lower_name == "see also":
-                contents = _parse_see_also(data[2:], errors=errors, indent=indent)
+            valid = SECTION_UNDERLINE_PATTERN.match(underline)
+
+            lower_name = sys.intern(name.lower())
+            parser = _SECTION_PARSERS.get(lower_name)
+            if parser is not None:
+                parse_contents, reports_errors = parser
+                if reports_errors:
+                    contents = parse_contents(data[2:], indent=indent, errors=errors)
+                else:
+                    contents = parse_contents(data[2:], indent=indent)
             else:
                 contents = strip_empty_lines(data[:2])  # TODO: skip
 
@@ -594,14 +691,27 @@ def _parse_sections(
     return sections
 
 
+def _may_have_sections(raw: str) -> bool:
+    # Joined line continuations can form an underline that is not in `raw`.
+    return (
+        SECTION_UNDERLINE_PATTERN.search(raw) is not None
+        or ".. index::" in raw
+        or "\\" in raw
+    )
+
+
 def parse_docstring(node: parso.python.tree.Node) -> Tuple[DocString, List[Error]]:
     errors = []
     start = Pos(node.start_pos[0], node.start_pos[1] + 1)
     end = Pos(node.end_pos[0], node.end_pos[1] + 1)
     indent, lines, raw = _format_raw_doc(node.get_code(), start)
     reader = Reader(lines)
-    summary = _parse_summary(reader=reader)
-    sections = _parse_sections(reader=reader, errors=errors, indent=indent)
+    if _may_have_sections(raw):
+        summary = _parse_summary(reader=reader)
+        sections = _parse_sections(reader=reader, errors=errors, indent=indent)
+    else:
+        summary = _parse_summary_extended_summary(reader)
+        sections = {}
     return (
         DocString(
             start=start,
@@ -616,28 +726,41 @@ def parse_docstring(node: parso.python.tree.Node) -> Tuple[DocString, List[Error
     )
 
 
-class Node(metaclass=ABCMeta):
+class Node:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "type" not in cls.__dict__:
+            raise TypeError(f"{cls.__name__} must override `type`")
+
     def __init__(self, node, filename):
         self.node = node
-        self.docstring_node = _get_docstring_node(self.node)
-        # if docstring_node is not None:
-        #     self._docstring = parse_docstring(docstring_node)
-        # else:
-        #     self._docstring = None
-
         self._name = None
+        self._parsed_docstring = None
         self.filename = filename
-        self._noqa = []
+
+    @cached_property
+    def docstring_node(self):
+        return _get_docstring_node(self.node)
+
+    @cached_property
+    def source_lines(self) -> List[str]:
+        lines = self.node.get_code().splitlines()
+        i = 0
+        while not lines[i].strip():
+            i += 1
+        return lines[i:]
 
     def parse_docstring(self) -> Tuple[Optional[DocString], List[Error]]:
-        return (
-            parse_docstring(self.docstring_node)
-            if self.docstring_node is not None
-            else (
-                None,
-                [],
+        if self._parsed_docstring is None:
+            self._parsed_docstring = (
+                parse_docstring(self.docstring_node)
+                if self.docstring_node is not None
+                else (
+                    None,
+                    [],
+                )
             )
-        )
+        return self._parsed_docstring
 
     @property
     def is_private(self):
@@ -656,16 +779,20 @@ class Node(metaclass=ABCMeta):
     def has_docstring(self):
         return self.docstring_node is not None
 
-    @property
+    @cached_property
     def noqa(self) -> List[str]:
-        return self._noqa
+        prefix = self._noqa_prefix()
+        return _find_noqa(prefix) if prefix is not None else []
+
+    def _noqa_prefix(self) -> Optional[str]:
+        return self.node.children[0].prefix
 
     def is_error_ignored(self, code):
         return code in self.noqa
 
-    @abstractproperty
+    @property
     def type(self):
-        pass
+        raise NotImplementedError
 
     @property
     def name(self) -> Name:
@@ -679,12 +806,12 @@ class Node(metaclass=ABCMeta):
             )
         return self._name
 
-    @property
+    @cached_property
     def start(self):
         line, col = self.node.start_pos
         return Pos(line, col + 1)
 
-    @property
+    @cached_property
     def end(self):
         line, col = self.node.end_pos
         return Pos(line, col + 1)
@@ -703,25 +830,30 @@ class Node(metaclass=ABCMeta):
             )
 
 
+_NOQA_PATTERN = re.compile(r"#\s+noqa:\s+([\w,\s]+)")
+_NOQA_CODE_PATTERN = re.compile(r"\w+")
+
+
 def _find_noqa(prefix: str) -> List[str]:
     prefix = prefix.strip()
     if prefix:
         prefix = prefix.splitlines()[-1].strip()
-        match = re.match(r"#\s+noqa:\s+([\w,\s]+)", prefix)
+        match = _NOQA_PATTERN.match(prefix)
         if match:
-            return re.findall("\w+", match.group(1))
+            return [
+                sys.intern(code) for code in _NOQA_CODE_PATTERN.findall(match.group(1))
+            ]
 
     return []
 
 
 class Module(Node):
-    def __init__(self, node, filename):
-        super().__init__(node, filename)
+    def _noqa_prefix(self) -> Optional[str]:
         if self.has_docstring:
             child = self.node.children[0]
             if child.type == "simple_stmt":
-                prefix = child.children[0].prefix
-                self._noqa = _find_noqa(prefix)
+                return child.children[0].prefix
+        return None
 
     @property
     def name(self):
@@ -735,11 +867,6 @@ class Module(Node):
 
 
 class Constant(Node):
-    def __init__(self, node, filename):
-        super().__init__(node, filename)
-        child = self.node.children[0]
-        self._noqa = _find_noqa(child.prefix)
-
     @property
     def name(self):
         return self.node.children[0].value
@@ -750,30 +877,31 @@ class Constant(Node):
 
 
 def _wrap_parameters(params: List[parso.python.tree.Param]):
-    return [
-        Parameter(
-            start=Pos(param.start_pos[0], param.start_pos[1] + 1),
-            end=Pos(param.end_pos[0], param.end_pos[1] + 1),
-            name=param.name.value,
-            default=param.default.get_code(include_prefix=False)
-            if param.default is not None
-            else None,
-            annotation=param.annotation.get_code(include_prefix=False)
-            if param.annotation is not None
-            else None,
-            star_count=param.star_count,
+    parameters = []
+    for param in params:
+        start_line, start_column = param.start_pos
+        end_line, end_column = param.end_pos
+        default = param.default
+        annotation = param.annotation
+        parameters.append(
+            Parameter(
+                start=Pos(start_line, start_column + 1),
+                end=Pos(end_line, end_column + 1),
+                name=param.name.value,
+                default=default.get_code(include_prefix=False)
+                if default is not None
+                else None,
+                annotation=annotation.get_code(include_prefix=False)
+                if annotation is not None
+                else None,
+                star_count=param.star_count,
+            )
         )
-        for param in params
-    ]
+    return parameters
 
 
 class Class(Node):
-    def __init__(self, node, filename):
-        super().__init__(node, filename)
-        child = self.node.children[0]
-        self._noqa = _find_noqa(child.prefix)
-
-    @property
+    @cached_property
     def parameters(self):
         init = None
         for func in self.node.iter_funcdefs():
@@ -796,12 +924,7 @@ class Class(Node):
 
 
 class FunctionDocstring(Node):
-    def __init__(self, node, filename):
-        super().__init__(node, filename)
-        child = self.node.children[0]
-        self._noqa = _find_noqa(child.prefix)
-
-    @property
+    @cached_property
     def parameters(self):
         return _wrap_parameters(self.node.get_params())
 
@@ -823,7 +946,7 @@ class FunctionDocstring(Node):
 
 
 class Method(FunctionDocstring):
-    @property
+    @cached_property
     def parameters(self):
         return _wrap_parameters(self.node.get_params()[1:])
 
@@ -844,12 +967,49 @@ class Method(FunctionDocstring):
             yield from super().validate()
 
 
+# The nodes parso searches in `iter_funcdefs` and `iter_classdefs`.
+_SCOPE_CONTAINERS = frozenset(
+    [
+        "suite",
+        "simple_stmt",
+        "decorated",
+        "async_funcdef",
+        "if_stmt",
+        "while_stmt",
+        "for_stmt",
+        "try_stmt",
+        "with_stmt",
+        "async_stmt",
+    ]
+)
+
+
+def _find_scopes(children, functions, classes):
+    for element in children:
+        type = element.type
+        if type == "funcdef":
+            functions.append(element)
+        elif type == "classdef":
+            classes.append(element)
+        elif type in _SCOPE_CONTAINERS:
+            _find_scopes(element.children, functions, classes)
+
+
+_GRAMMARS = {}
+
+
 class Parser:
     def __init__(self, python_version=None) -> None:
         self.python_version = python_version or _PYTHON_VERSION
 
     def _load_grammar(self) -> parso.Grammar:
-        return parso.load_grammar(version=self.python_version)
+        grammar = _GRAMMARS.get(self.python_version)
+        if grammar is None:
+            import parso
+
+            grammar = parso.load_grammar(version=self.python_version)
+            _GRAMMARS[self.python_version] = grammar
+        return grammar
 
     def _parse(self, code: str) -> Optional[parso.tree.BaseNode]:
         """Parse the Python code using the grammar of the current Python interpreter.
@@ -877,6 +1037,9 @@ class Parser:
     def iter_docstring(self, file):
         code = file.read()
         filename = file.name if hasattr(file, "name") else "<unkown>"
+        yield from self.iter_code_docstring(code, filename)
+
+    def iter_code_docstring(self, code: str, filename: str = "<unkown>"):
         module = self._parse(code).get_root_node()
         yield Module(module, filename)
 
@@ -884,10 +1047,13 @@ class Parser:
         # for const in module._search_in_scope("expr_stmt"):
         #     yield Constant(const)
 
-        for func in module.iter_funcdefs():
+        # Functions are reported before classes.
+        functions, classes = [], []
+        _find_scopes(module.children, functions, classes)
+        for func in functions:
             yield FunctionDocstring(func, filename)
 
-        for klass in module.iter_classdefs():
+        for klass in classes:
             yield Class(klass, filename)
             for func in klass.iter_funcdefs():
                 yield Method(func, filename)
@@ -12,18 +12,25 @@ from ._config import Config
 class Validator:
     def __init__(self, config: Config = None) -> None:
         self.config = config
-        self.checks = self.config.get_checks()
+        self.checks = tuple(self.config.get_checks())
+        self._checks_without_summary = tuple(
+            check for check in self.checks if not check.requires_summary
+        )
 
     def validate(self, node: Node) -> Generator[Error, None, None]:
-        if self.config.is_node_excluded(node):
+        config = self.config
+        if config.is_node_excluded(node):
             return
 
+        is_error_ignored = node.is_error_ignored
+        is_config_error_ignored = config.is_error_ignored
+
         # First we let the node validate it self for possible errors.
         any_errors = False
         for error in node.validate():
-            if not node.is_error_ignored(
+            if not is_error_ignored(error.code) and not is_config_error_ignored(
                 error.code
-            ) and not self.config.is_error_ignored(error.code):
+            ):
                 yield error
                 any_errors = True
 
@@ -34,65 +41,79 @@ class Validator:
         # We define errores as those warnings that would result in incorrect rendering.
         docstring, errors = node.parse_docstring()
         for error in errors:
-            if not node.is_error_ignored(
+            if not is_error_ignored(error.code) and not is_config_error_ignored(
                 error.code
-            ) and not self.config.is_error_ignored(error.code):
+            ):
                 yield error
 
         # Finally, if the docstring could be parsed and exists, we run all
         # checks, ignoring those checks that the user excludes.
         #
-        # NOTE: the `checks` array should only contain the checks explicitly
-        # requested by the user.
+        # NOTE: `checks` only contains the checks selected by the user.
         if docstring:
-            for check in self.checks:
-                if not node.is_error_ignored(
-                    check.name
-                ) and not self.config.is_error_ignored(check.name):
-                    for error in check.validate(node, docstring):
-                        yield error
+            checks = (
+                self.checks
+                if docstring.summary is not None
+                else self._checks_without_summary
+            )
+            noqa = node.noqa
+            for check in checks:
+                if check.name not in noqa:
+                    yield from check.validate(node, docstring)
 
 
 class ErrorFormatter:
     def __init__(self):
         self._errors: Mapping[str, Iterable[Tuple[Node, Error]]] = defaultdict(list)
+        self._n_errors = 0
 
     def add_error(self, file: str, node: Node, error: Error) -> None:
         self._errors[file].append((node, error))
+        self._n_errors += 1
+
+    def add_errors(self, file: str, errors: Iterable[Tuple[Node, Error]]) -> None:
+        """
+        Add all errors found in a file.
+
+        Parameters
+        ----------
+        file : str
+            The file name.
+        errors : Iterable[Tuple[Node, Error]]
+            The node and error pairs.
+        """
+        if errors:
+            self._errors[file].extend(errors)
+            self._n_errors += len(errors)
 
     def _format_error(self, file: str, node: Node, error: Error):
-        return "{}:{}:{}:{}:{}: {} {}\n".format(
-            file,
-            error.start.line,
-            error.start.column,
-            error.end.line,
-            error.end.column,
-            error.code,
-            error.message,
+        start, end = error.start, error.end
+        return (
+            f"{file}:{start.line}:{start.column}:{end.line}:{end.column}: "
+            f"{error.code} {error.message}\n"
         )
 
     def write(self, output: io.TextIOBase) -> None:
+        format_error = self._format_error
         for file, errors in self._errors.items():
-            for node, error in errors:
-                output.write(self._format_error(file, node, error))
+            output.write(
+                "".join([format_error(file, node, error) for node, error in errors])
+            )
 
     @property
     def has_errors(self):
-        return len(self._errors) > 0
+        return self._n_errors > 0
 
     @property
     def errors(self):
-        return sum(len(errors) for errors in self._errors.values())
+        return self._n_errors
 
 
 class DetailedErrorFormatter(ErrorFormatter):
     def _format_error(self, file: str, node: Node, error: Error) -> str:
         if node.has_docstring:
             line = str(error.start.line)
-            docstring = node.node.get_code().splitlines()
-            while not docstring[0].strip():
-                docstring.pop(0)
-
+            docstring = node.source_lines
             start = Pos(*node.node.start_pos)
 
             error_start = error.start.normalize(start)
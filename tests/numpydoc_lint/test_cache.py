@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+from numpydoc_lint._cache import ResultCache, package_fingerprint
+
+
+def test_result_cache_roundtrip(tmp_path):
+    cache = ResultCache(tmp_path / "cache", "settings")
+    assert cache.get("code", "file.py") is None
+
+    cache.set("code", "file.py", ("file.py:1:1:1:1: H0000 Error.\n", 1))
+    assert cache.get("code", "file.py") == ("file.py:1:1:1:1: H0000 Error.\n", 1)
+
+
+def test_result_cache_miss_on_change(tmp_path):
+    cache = ResultCache(tmp_path, "settings")
+    cache.set("code", "file.py", ("", 0))
+
+    assert cache.get("changed code", "file.py") is None
+    assert cache.get("code", "other.py") is None
+    assert ResultCache(tmp_path, "other settings").get("code", "file.py") is None
+
+
+def test_result_cache_removes_temporary_file_on_error(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path, "settings")
+
+    def fail(*args):
+        raise OSError()
+
+    monkeypatch.setattr(os, "replace", fail)
+    cache.set("code", "file.py", ("", 0))
+    assert list(tmp_path.iterdir()) == []
+
+    monkeypatch.undo()
+    with pytest.raises(TypeError):
+        cache.set("code", "file.py", (object(), 0))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_package_fingerprint_is_stable():
+    assert package_fingerprint() == package_fingerprint()
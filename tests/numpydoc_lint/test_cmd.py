@@ -0,0 +1,163 @@
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from numpydoc_lint._config import Config
+from numpydoc_lint import cmd
+from numpydoc_lint.cmd import _argument_parser, _iter_python_files, _parse_args, run
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["src"],
+        ["-"],
+        ["src", "--format", "full"],
+        ["--ignore", "I0001", "H0002", "src"],
+        ["src", "--ignore", "--select", "I00"],
+        ["--exclude", "tests", "--include-private", "--exclude-magic", "src"],
+        ["--stdin-filename", "module.py", "-j", "2", "--cache-dir", ".cache"],
+        ["src", "--jobs", "1", "--ignore", "I0001", "--ignore", "I0002"],
+    ],
+)
+def test_parse_args_matches_argparse(argv):
+    assert vars(_parse_args(argv)) == vars(_argument_parser().parse_args(argv))
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["-h"],
+        ["--help"],
+        ["src", "tests"],
+        ["--format", "other"],
+        ["--format=full"],
+        ["--form", "full"],
+        ["-j", "many"],
+        ["--jobs"],
+        ["--stdin-filename", "--format", "full"],
+        ["--format", "c", "--format", "full"],
+        ["--format", "src", "bad", "--format", "full"],
+    ],
+)
+def test_parse_args_defers_to_argparse(argv):
+    assert _parse_args(argv) is None
+
+
+def _make_tree(root):
+    for name in [
+        "src/mod.py",
+        "src/pkg/__init__.py",
+        "tests/test_a.py",
+        "tests/test_utils/mod.py",
+        "setup.py",
+        "README.md",
+    ]:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('"""Module."""\n')
+
+
+@pytest.mark.parametrize("exclude", [None, ["src"], ["test_*"], ["src/*.py"]])
+def test_iter_python_files_matches_rglob(tmp_path, exclude):
+    _make_tree(tmp_path)
+    config = Config(exclude=exclude)
+    expected = [
+        path
+        for path in tmp_path.rglob("*.py")
+        if not (config.exclude and config.is_path_excluded(path))
+    ]
+    assert list(_iter_python_files(tmp_path, config)) == expected
+
+
+def test_iter_python_files_exclude_is_per_file(tmp_path):
+    _make_tree(tmp_path)
+    files = {
+        path.relative_to(tmp_path).as_posix()
+        for path in _iter_python_files(tmp_path, Config(exclude=["src", "test_*"]))
+    }
+    # Patterns are matched against files, so a pattern that only matches a
+    # directory name does not exclude the files below it.
+    assert files == {
+        "src/mod.py",
+        "src/pkg/__init__.py",
+        "tests/test_utils/mod.py",
+        "setup.py",
+    }
+
+
+def _run(monkeypatch, capsys, argv):
+    monkeypatch.setattr(sys, "argv", ["numpydoc_lint", *argv])
+    with pytest.raises(SystemExit) as exit:
+        run()
+    return capsys.readouterr().out, exit.value.code
+
+
+def test_run_in_parallel_matches_serial(tmp_path, monkeypatch, capsys):
+    for i in range(8):
+        package = tmp_path / f"package{i % 3}"
+        package.mkdir(exist_ok=True)
+        (package / f"module{i}.py").write_text(
+            '"""Module."""\n\n\n'
+            "def function(a, b):\n"
+            '    """summary without period\n\n'
+            "    Parameters\n"
+            "    ----------\n"
+            "    a : int\n"
+            '    """\n'
+        )
+
+    serial, serial_code = _run(monkeypatch, capsys, [str(tmp_path), "-j", "1"])
+    parallel, parallel_code = _run(monkeypatch, capsys, [str(tmp_path), "-j", "2"])
+    assert serial == parallel
+    assert serial_code == parallel_code == 1
+    assert serial.count("module") > 8
+    assert serial.endswith(f"Found {serial.count(chr(10)) - 1} errors.\n")
+
+
+def test_run_without_errors(tmp_path, monkeypatch, capsys):
+    (tmp_path / "module.py").write_text('"""Module."""\n')
+    output, code = _run(monkeypatch, capsys, [str(tmp_path), "--ignore", "H0002"])
+    assert output == ""
+    assert code == 0
+
+
+def test_read_source_large_file(tmp_path, monkeypatch):
+    data = b'"""Module \xff."""\r\nx = 1\r\ny = 2\r' * 20000
+    assert len(data) > cmd._MMAP_THRESHOLD
+    path = tmp_path / "module.py"
+    path.write_bytes(data)
+
+    expected = '"""Module �."""\nx = 1\ny = 2\n' * 20000
+    assert cmd._read_source(path) == expected
+
+    monkeypatch.setattr(cmd, "_MMAP_THRESHOLD", len(data))
+    assert cmd._read_source(path) == expected
+
+
+def test_read_stdin(monkeypatch):
+    stdin = io.TextIOWrapper(io.BytesIO(b"x = 1\r\n\xff\r"), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    assert cmd._read_stdin() == "x = 1\n�\n"
+
+
+def test_iter_python_files_skips_unreadable_directories(tmp_path, monkeypatch):
+    _make_tree(tmp_path)
+    scandir = os.scandir
+    denied = tmp_path / "tests"
+
+    def deny(path):
+        if Path(path) == denied:
+            raise PermissionError(13, "Permission denied")
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", deny)
+    files = {
+        path.relative_to(tmp_path).as_posix()
+        for path in _iter_python_files(tmp_path, Config())
+    }
+    assert files == {"src/mod.py", "src/pkg/__init__.py", "setup.py"}
@@ -0,0 +1,39 @@
+from numpydoc_lint._config import Config, load_config_from_pyproject
+
+
+def test_load_config_from_parent_directory(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.numpydoc-lint]\nignore = ["H0002"]\ninclude-private = true\n'
+    )
+    package = tmp_path / "src" / "package"
+    package.mkdir(parents=True)
+    module = package / "module.py"
+    module.write_text("")
+
+    config = load_config_from_pyproject(module)
+    assert config.ignore == ["H0002"]
+    assert config.include_private
+    assert config is load_config_from_pyproject(package)
+
+
+def test_load_config_without_numpydoc_lint_table(tmp_path):
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "test"\n')
+
+    config = load_config_from_pyproject(tmp_path)
+    assert config.is_defined
+    assert config.ignore is None
+
+
+def test_config_select_and_ignore():
+    config = Config(select=["I00", "W0101"], ignore=["I0001"])
+    assert config.is_selected("I0002")
+    assert config.is_selected("W0101")
+    assert not config.is_selected("W0102")
+    assert not config.is_selected("I0")
+    assert config.is_error_ignored("I0001")
+    assert config.is_error_ignored("E0001")
+    assert not config.is_error_ignored("I0002")
+
+    assert Config(select=[""]).is_selected("E0001")
+    assert not Config(select=[]).is_selected("E0001")
+    assert Config().is_selected("E0001")
@@ -1,7 +1,9 @@
 import pytest
 from io import StringIO
-from numpydoc_lint.numpydoc import Parser
+from numpydoc_lint.numpydoc import Node, Parser, _split_types, _TYPE_PATTERN
 from numpydoc_lint._model import Pos
+from numpydoc_lint._config import Config
+from numpydoc_lint.validate import Validator
 
 
 def parse_code(code):
@@ -120,10 +122,21 @@ def f():
         Test
     """
 '''
-    doc, errors = parse_docstring(code, nth=1)
+    node = parse_code(code)[1]
+    doc, errors = node.parse_docstring()
     assert len(errors) == 0
     assert doc.summary == None
 
+    # The validator skips the checks that require a summary.
+    validator = Validator(Config())
+    summary_checks = {
+        check.name for check in validator.checks if check.requires_summary
+    }
+    assert summary_checks
+    codes = {error.code for error in validator.validate(node)}
+    assert "H0002" in codes
+    assert not codes & summary_checks
+
 
 def test_raw_string_lines():
     code = r'''
@@ -144,6 +157,21 @@ def f():
     assert doc.lines[4].value == "    a : obj lol"
 
 
+def test_single_quoted_docstring():
+    code = """
+def f():
+    '''Summary "quoted".
+
+    Extended.
+    '''
+"""
+    doc, errors = parse_docstring(code, nth=1)
+    assert len(errors) == 0
+    assert doc.indent == 4
+    assert doc.lines[0].value == '    Summary "quoted".'
+    assert doc.summary.content.data[0].value.strip() == 'Summary "quoted".'
+
+
 def test_parse_see_also():
     code = r'''
 def f():
@@ -195,3 +223,29 @@ def f():
 
     assert errors[2].code == "E0003"
     assert errors[2].start == Pos(17, 5)
+
+
+@pytest.mark.parametrize(
+    "types",
+    [
+        "int",
+        "int or None",
+        "array_like, optional",
+        "a,b  or  c ",
+        "color",
+        "int,  ",
+        '{"A", "B"} or int',
+        "A or B of shape (1, 2)",
+    ],
+)
+def test_split_types(types):
+    assert _split_types(types) == [
+        match.span(1) for match in _TYPE_PATTERN.finditer(types)
+    ]
+
+
+def test_node_subclass_must_override_type():
+    with pytest.raises(TypeError):
+
+        class Incomplete(Node):
+            pass